@@ -3,10 +3,12 @@ package main
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"os"
 	"os/signal"
 	"syscall"
+	"time"
 
 	"github.com/book-expert/logger"
 	"github.com/book-expert/tts-service/internal/config"
@@ -17,6 +19,10 @@ import (
 	"github.com/nats-io/nats.go"
 )
 
+// errForcedShutdown reports that a second signal aborted the jobs still
+// draining at shutdown.
+var errForcedShutdown = errors.New("shutdown forced by a second signal, in-flight jobs aborted")
+
 func setupLogger(logPath string) (*logger.Logger, error) {
 	log, err := logger.New(logPath, "tts-service.log")
 	if err != nil {
@@ -48,24 +54,31 @@ func bootstrap() (*config.Config, *logger.Logger, error) {
 	return cfg, bootstrapLog, nil
 }
 
-func startWorker(ctx context.Context, cfg *config.Config, log *logger.Logger) (context.CancelFunc, error) {
-	natsConnection, err := nats.Connect(cfg.NATS.URL)
+// startWorker connects to NATS and runs the worker in the background. The
+// returned done channel is closed once the worker has stopped and its NATS
+// connection is closed; the returned stop function cancels the worker, waits
+// for that to happen and returns the error the worker stopped with. Jobs run
+// under jobCtx, so cancelling it aborts them even while the worker drains.
+func startWorker(
+	ctx, jobCtx context.Context, cfg *config.Config, log *logger.Logger,
+) (func() error, <-chan struct{}, error) {
+	natsConnection, err := nats.Connect(cfg.NATS.URL, nats.ErrorHandler(natsErrorHandler(log)))
 	if err != nil {
-		return nil, fmt.Errorf("failed to connect to NATS: %w", err)
+		return nil, nil, fmt.Errorf("failed to connect to NATS: %w", err)
 	}
 
 	jetstreamContext, err := natsConnection.JetStream()
 	if err != nil {
 		natsConnection.Close()
 
-		return nil, fmt.Errorf("failed to get JetStream context: %w", err)
+		return nil, nil, fmt.Errorf("failed to get JetStream context: %w", err)
 	}
 
 	store, err := objectstore.New(jetstreamContext, cfg.NATS.AudioObjectStoreBucket)
 	if err != nil {
 		natsConnection.Close()
 
-		return nil, fmt.Errorf("failed to create object store: %w", err)
+		return nil, nil, fmt.Errorf("failed to create object store: %w", err)
 	}
 
 	processor, err := tts.New(core.TTSConfig{
@@ -77,11 +90,23 @@ func startWorker(ctx context.Context, cfg *config.Config, log *logger.Logger) (c
 		TopP:              cfg.TTS.TopP,
 		RepetitionPenalty: cfg.TTS.RepetitionPenalty,
 		Temperature:       cfg.TTS.Temperature,
+		Threads:           cfg.TTS.Threads,
+		BatchSize:         cfg.TTS.BatchSize,
+		CacheDType:        cfg.TTS.CacheDType,
 	}, log)
 	if err != nil {
 		natsConnection.Close()
 
-		return nil, fmt.Errorf("failed to create TTS processor: %w", err)
+		return nil, nil, fmt.Errorf("failed to create TTS processor: %w", err)
+	}
+
+	warmupProcessor(ctx, processor, log)
+
+	// A signal during warmup means the service should not start serving.
+	if ctx.Err() != nil {
+		natsConnection.Close()
+
+		return nil, nil, fmt.Errorf("startup interrupted: %w", ctx.Err())
 	}
 
 	natsWorker, err := worker.NewNatsWorker(
@@ -90,15 +115,20 @@ func startWorker(ctx context.Context, cfg *config.Config, log *logger.Logger) (c
 	if err != nil {
 		natsConnection.Close()
 
-		return nil, fmt.Errorf("failed to create NATS worker: %w", err)
+		return nil, nil, fmt.Errorf("failed to create NATS worker: %w", err)
 	}
 
 	workerCtx, workerCancel := context.WithCancel(ctx)
+	done := make(chan struct{})
+
+	// runErr is written before done is closed and only read after it is.
+	var runErr error
 
 	go func() {
+		defer close(done)
 		defer natsConnection.Close()
 
-		runErr := natsWorker.Run(workerCtx)
+		runErr = natsWorker.Run(workerCtx, jobCtx)
 		if runErr != nil {
 			log.Error("NATS worker stopped with error: %v", runErr)
 			workerCancel() // Ensure other dependent goroutines are stopped
@@ -107,14 +137,72 @@ func startWorker(ctx context.Context, cfg *config.Config, log *logger.Logger) (c
 
 	log.System("TTS-Service successfully initialized. Listening for jobs on subject: %s", cfg.NATS.TextProcessedSubject)
 
-	return workerCancel, nil
+	stop := func() error {
+		workerCancel()
+		<-done
+
+		if runErr != nil {
+			return fmt.Errorf("NATS worker stopped with error: %w", runErr)
+		}
+
+		return nil
+	}
+
+	return stop, done, nil
+}
+
+// natsErrorHandler logs asynchronous NATS errors. When the worker falls behind
+// its subscription's pending limits, the client drops jobs and reports it only
+// here as nats.ErrSlowConsumer, so those drops are logged with their count.
+func natsErrorHandler(log *logger.Logger) nats.ErrHandler {
+	return func(_ *nats.Conn, sub *nats.Subscription, err error) {
+		if sub == nil {
+			log.Error("NATS async error: %v", err)
+
+			return
+		}
+
+		if errors.Is(err, nats.ErrSlowConsumer) {
+			dropped, droppedErr := sub.Dropped()
+			if droppedErr == nil {
+				log.Error("Slow consumer on subject %s: %d TTS jobs dropped so far", sub.Subject, dropped)
+
+				return
+			}
+		}
+
+		log.Error("NATS async error on subject %s: %v", sub.Subject, err)
+	}
+}
+
+// warmupProcessor reads the model files into the page cache before the worker
+// subscribes. A failed warmup is not fatal: the first job will simply read
+// them from disk. A warmup cut short by a shutdown signal is not reported as
+// a failure.
+func warmupProcessor(ctx context.Context, processor *tts.ChatLLMProcessor, log *logger.Logger) {
+	start := time.Now()
+
+	err := processor.Warmup(ctx)
+	if err != nil {
+		if ctx.Err() == nil {
+			log.Warn("TTS warmup failed, continuing without it: %v", err)
+		}
+
+		return
+	}
+
+	log.Info("TTS model files warmed in %s", time.Since(start))
 }
 
-func waitForShutdownSignal(log *logger.Logger) {
-	sigChan := make(chan os.Signal, 1)
-	signal.Notify(sigChan, syscall.SIGINT, syscall.SIGTERM)
-	<-sigChan
-	log.Info("Shutdown signal received, gracefully shutting down...")
+// waitForShutdown blocks until a termination signal cancels ctx or the worker
+// stops on its own.
+func waitForShutdown(ctx context.Context, log *logger.Logger, workerDone <-chan struct{}) {
+	select {
+	case <-ctx.Done():
+		log.Info("Shutdown signal received, gracefully shutting down...")
+	case <-workerDone:
+		log.Warn("Worker stopped unexpectedly, shutting down...")
+	}
 }
 
 func run() error {
@@ -137,24 +225,80 @@ func run() error {
 		}
 	}()
 
-	ctx, cancel := context.WithCancel(context.Background())
-	defer cancel()
+	// Signals cancel the root context directly, so a shutdown requested during
+	// the model file warmup interrupts it instead of waiting for it to finish.
+	// Jobs the worker has already accepted run to completion during the drain
+	// unless a second signal cancels jobCtx.
+	ctx, stopSignals := signal.NotifyContext(context.Background(), syscall.SIGINT, syscall.SIGTERM)
+	defer stopSignals()
+
+	jobCtx, hardStop := context.WithCancel(context.Background())
+	defer hardStop()
 
-	workerCancel, err := startWorker(ctx, cfg, log)
+	stopWorker, workerDone, err := startWorker(ctx, jobCtx, cfg, log)
 	if err != nil {
+		if ctx.Err() != nil {
+			log.Info("Shutdown signal received during startup.")
+
+			return nil
+		}
+
 		log.Error("Failed to start worker: %v", err)
 
 		return err
 	}
 
-	waitForShutdownSignal(log)
-	workerCancel()
+	waitForShutdown(ctx, log, workerDone)
+
+	forced := hardStopOnSignal(log, hardStop, workerDone)
+	stopSignals()
+	// Wait for queued jobs to finish and the NATS connection to close before
+	// the logger is closed.
+	workerErr := stopWorker()
+
+	select {
+	case <-forced:
+		return errForcedShutdown
+	default:
+	}
+
+	if workerErr != nil {
+		return workerErr
+	}
 
 	log.Info("Shutdown complete.")
 
 	return nil
 }
 
+// hardStopOnSignal calls hardStop if another SIGINT or SIGTERM arrives before
+// workerDone is closed. Cancelling the job context kills chatllm's process
+// group and removes its temporary files, so the drain ends promptly instead
+// of the service exiting with chatllm still running. The returned channel is
+// closed when that happens.
+func hardStopOnSignal(
+	log *logger.Logger, hardStop context.CancelFunc, workerDone <-chan struct{},
+) <-chan struct{} {
+	signals := make(chan os.Signal, 1)
+	signal.Notify(signals, syscall.SIGINT, syscall.SIGTERM)
+
+	forced := make(chan struct{})
+
+	go func() {
+		defer signal.Stop(signals)
+
+		select {
+		case <-signals:
+			log.Warn("Second signal received, aborting in-flight jobs...")
+			close(forced)
+			hardStop()
+		case <-workerDone:
+		}
+	}()
+
+	return forced
+}
+
 func main() {
 	err := run()
 	if err != nil {
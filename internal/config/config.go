@@ -2,11 +2,19 @@
 package config
 
 import (
+	"errors"
 	"fmt"
 	"github.com/book-expert/configurator"
 	"github.com/book-expert/logger"
 )
 
+var (
+	// ErrNegativeThreads indicates that tts_service.threads is negative.
+	ErrNegativeThreads = errors.New("tts_service.threads must be non-negative")
+	// ErrNegativeBatchSize indicates that tts_service.batch_size is negative.
+	ErrNegativeBatchSize = errors.New("tts_service.batch_size must be non-negative")
+)
+
 // NATSConfig holds the configuration for NATS.
 type NATSConfig struct {
 	URL                      string `toml:"url"`
@@ -28,6 +36,9 @@ type TTSServiceConfig struct {
 	NGL               int     `toml:"ngl"`
 	TopP              float64 `toml:"top_p"`
 	RepetitionPenalty float64 `toml:"repetition_penalty"`
+	Threads           int     `toml:"threads"`
+	BatchSize         int     `toml:"batch_size"`
+	CacheDType        string  `toml:"cache_dtype"`
 }
 
 // Config is the root configuration structure.
@@ -45,5 +56,24 @@ func Load(log *logger.Logger) (*Config, error) {
 		return nil, fmt.Errorf("failed to load configuration from configurator: %w", err)
 	}
 
+	err = cfg.TTS.Validate()
+	if err != nil {
+		return nil, fmt.Errorf("invalid configuration: %w", err)
+	}
+
 	return &cfg, nil
 }
+
+// Validate rejects settings that chatllm would otherwise receive verbatim.
+// Zero keeps the default for both threads and batch_size.
+func (c *TTSServiceConfig) Validate() error {
+	if c.Threads < 0 {
+		return fmt.Errorf("%w: got %d", ErrNegativeThreads, c.Threads)
+	}
+
+	if c.BatchSize < 0 {
+		return fmt.Errorf("%w: got %d", ErrNegativeBatchSize, c.BatchSize)
+	}
+
+	return nil
+}
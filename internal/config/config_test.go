@@ -26,6 +26,9 @@ audio_object_store_bucket = "AUDIO_FILES"
 model_path = "models/outetts.bin"
 temperature = 0.7
 timeout_seconds = 300
+threads = 8
+batch_size = 2048
+cache_dtype = "f16"
 `
 
 	var cfg config.Config
@@ -42,4 +45,53 @@ timeout_seconds = 300
 	assert.Equal(t, "models/outetts.bin", cfg.TTS.ModelPath)
 	assert.InEpsilon(t, 0.7, cfg.TTS.Temperature, 0.001)
 	assert.Equal(t, 300, cfg.TTS.TimeoutSeconds)
+	assert.Equal(t, 8, cfg.TTS.Threads)
+	assert.Equal(t, 2048, cfg.TTS.BatchSize)
+	assert.Equal(t, "f16", cfg.TTS.CacheDType)
+}
+
+func TestTTSServiceConfig_Validate(t *testing.T) {
+	t.Parallel()
+
+	testCases := []struct {
+		name      string
+		threads   int
+		batchSize int
+		wantErr   error
+	}{
+		{name: "defaults", threads: 0, batchSize: 0, wantErr: nil},
+		{name: "explicit", threads: 8, batchSize: 2048, wantErr: nil},
+		{name: "negative threads", threads: -1, batchSize: 0, wantErr: config.ErrNegativeThreads},
+		{name: "negative batch size", threads: 0, batchSize: -512, wantErr: config.ErrNegativeBatchSize},
+	}
+
+	for _, testCase := range testCases {
+		t.Run(testCase.name, func(t *testing.T) {
+			t.Parallel()
+
+			cfg := config.TTSServiceConfig{
+				ModelPath:         "",
+				SnacModelPath:     "",
+				Voice:             "",
+				Temperature:       0,
+				TimeoutSeconds:    0,
+				Seed:              0,
+				NGL:               0,
+				TopP:              0,
+				RepetitionPenalty: 0,
+				Threads:           testCase.threads,
+				BatchSize:         testCase.batchSize,
+				CacheDType:        "",
+			}
+
+			err := cfg.Validate()
+			if testCase.wantErr == nil {
+				require.NoError(t, err)
+
+				return
+			}
+
+			require.ErrorIs(t, err, testCase.wantErr)
+		})
+	}
 }
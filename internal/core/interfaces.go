@@ -20,6 +20,19 @@ type TTSConfig struct {
 	TopP              float64
 	RepetitionPenalty float64
 	Temperature       float64
+
+	// The fields below are process-wide: the processor reads them once when it
+	// is constructed and ignores them in the per-job config passed to Process.
+
+	// Threads is the number of CPU threads chatllm may use; 0 selects a default
+	// based on the host's core count.
+	Threads int
+	// BatchSize is the prompt-processing batch size passed to chatllm; 0 keeps
+	// chatllm's built-in default.
+	BatchSize int
+	// CacheDType is the data type of chatllm's KV cache (e.g. "f16"); an empty
+	// value keeps chatllm's built-in default.
+	CacheDType string
 }
 
 // TTSProcessor defines the interface for a text-to-speech processing engine.
@@ -8,8 +8,10 @@ package tts
 import (
 	"errors"
 	"fmt"
+	"maps"
 	"os"
 	"path/filepath"
+	"slices"
 	"strings"
 )
 
@@ -34,9 +36,9 @@ const (
 	summaryRecommendations = "Recommendations: %d\n"
 )
 
-// List item format.
+// List item prefix.
 const (
-	listItemFormat = "  - %s\n"
+	listItemPrefix = "  - "
 )
 
 // Static errors.
@@ -60,20 +62,20 @@ type CleanupReport struct {
 	Errors          []string
 }
 
-// AnalyzeOuteTTSCleanup analyzes what can be cleaned up from OuteTTS Python
-// implementation.
-func getRemovableFiles() []string {
-	return []string{
+// The OuteTTS layout below is fixed, so the lists are built once at package
+// initialization rather than on every analysis.
+var (
+	// removableFiles lists the OuteTTS Python files that have Go replacements.
+	removableFiles = []string{
 		"utils/chunking.py",      // Replaced by internal/chunking/chunking.go
 		"utils/preprocessing.py", // Can be implemented in Go
 		"utils/helpers.py",       // Simple utilities, can be Go
 		"anyascii/__init__.py",   // Can be pure Go implementation
 		"whisper/transcribe.py",  // Can use Go HTTP client for API calls
 	}
-}
 
-func getEssentialFiles() []string {
-	return []string{
+	// essentialFiles lists the OuteTTS files that implement ML functionality.
+	essentialFiles = []string{
 		"interface.py",              // Main OuteTTS interface
 		"version/interface.py",      // Core model interfaces
 		"version/playback.py",       // Audio playback
@@ -85,12 +87,13 @@ func getEssentialFiles() []string {
 		"models/vllm_model.py",      // VLLM model loading
 		"models/llamacpp_server.py", // Llama.cpp server integration
 	}
-}
 
-func getDirectoryLists() (removableDirs, essentialDirs []string) {
+	// removableDirs lists the OuteTTS directories that can be removed.
 	removableDirs = []string{
 		"anyascii/_data", // ASCII conversion data (can be Go)
 	}
+
+	// essentialDirs lists the OuteTTS directories that must be kept.
 	essentialDirs = []string{
 		"version/v1",    // Version 1 interface
 		"version/v2",    // Version 2 interface
@@ -100,85 +103,53 @@ func getDirectoryLists() (removableDirs, essentialDirs []string) {
 		"wav_tokenizer", // Audio tokenization
 	}
 
-	return removableDirs, essentialDirs
-}
-
-func analyzeRemovableFiles(outettsDir string, report *CleanupReport) {
-	removableFiles := getRemovableFiles()
-	for _, file := range removableFiles {
-		filePath := filepath.Join(outettsDir, file)
-
-		_, statErr := os.Stat(filePath)
-		if statErr == nil {
-			report.RemovedFiles = append(report.RemovedFiles, file)
-		}
+	// recommendations is the fixed advice attached to every cleanup report.
+	recommendations = []string{
+		"Text chunking has been replaced by Go implementation in internal/chunking/",
+		"Text preprocessing can be implemented in Go using regex and unicode packages",
+		"AnyASCII conversion can be pure Go using unicode normalization",
+		"Whisper integration can use Go HTTP client for API calls",
+		"Configuration management is now handled by Go structs",
+		"Audio file operations can use Go audio libraries",
+		"Keep core ML components (DAC, model loading, inference) in Python",
+		"Use Go for orchestration, Python for ML inference",
 	}
-}
-
-func analyzeEssentialFiles(outettsDir string, report *CleanupReport) {
-	essentialFiles := getEssentialFiles()
-	for _, file := range essentialFiles {
-		filePath := filepath.Join(outettsDir, file)
 
-		_, statErr := os.Stat(filePath)
-		if statErr == nil {
-			report.KeptFiles = append(report.KeptFiles, file)
-		}
+	// goReplacements maps Python files to their Go replacements.
+	goReplacements = map[string]string{
+		"utils/chunking.py":      "internal/chunking/chunking.go",
+		"utils/preprocessing.py": "internal/tts/text/preprocessing.go",
+		"utils/helpers.py":       "internal/tts/utils/helpers.go",
+		"anyascii/__init__.py":   "internal/tts/text/anyascii.go",
+		"whisper/transcribe.py":  "internal/tts/whisper/client.go",
+		"models/config.py":       "internal/tts/config/config.go",
 	}
-}
-
-func analyzeFiles(outettsDir string, report *CleanupReport) {
-	analyzeRemovableFiles(outettsDir, report)
-	analyzeEssentialFiles(outettsDir, report)
-}
+)
 
-func analyzeRemovableDirectories(
-	outettsDir string,
-	removableDirs []string,
-	report *CleanupReport,
-) {
-	for _, dir := range removableDirs {
-		dirPath := filepath.Join(outettsDir, dir)
+// appendExisting appends to found each entry that exists below root. The root
+// is cleaned once and each candidate costs a single stat call, instead of
+// re-cleaning the joined path for every entry.
+func appendExisting(found []string, root string, entries []string) []string {
+	prefix := filepath.Clean(root) + string(filepath.Separator)
 
-		_, statErr := os.Stat(dirPath)
+	for _, entry := range entries {
+		_, statErr := os.Stat(prefix + entry)
 		if statErr == nil {
-			report.RemovedDirs = append(report.RemovedDirs, dir)
+			found = append(found, entry)
 		}
 	}
-}
-
-func analyzeEssentialDirectories(
-	outettsDir string,
-	essentialDirs []string,
-	report *CleanupReport,
-) {
-	for _, dir := range essentialDirs {
-		dirPath := filepath.Join(outettsDir, dir)
 
-		_, statErr := os.Stat(dirPath)
-		if statErr == nil {
-			report.KeptDirs = append(report.KeptDirs, dir)
-		}
-	}
+	return found
 }
 
-func analyzeDirectories(outettsDir string, report *CleanupReport) {
-	removableDirs, essentialDirs := getDirectoryLists()
-	analyzeRemovableDirectories(outettsDir, removableDirs, report)
-	analyzeEssentialDirectories(outettsDir, essentialDirs, report)
+func analyzeFiles(outettsDir string, report *CleanupReport) {
+	report.RemovedFiles = appendExisting(report.RemovedFiles, outettsDir, removableFiles)
+	report.KeptFiles = appendExisting(report.KeptFiles, outettsDir, essentialFiles)
 }
 
-func generateRecommendations() []string {
-	return []string{
-		"Text chunking has been replaced by Go implementation in internal/chunking/",
-		"Text preprocessing can be implemented in Go using regex and unicode packages",
-		"AnyASCII conversion can be pure Go using unicode normalization",
-		"Whisper integration can use Go HTTP client for API calls",
-		"Configuration management is now handled by Go structs",
-		"Audio file operations can use Go audio libraries",
-		"Keep core ML components (DAC, model loading, inference) in Python",
-		"Use Go for orchestration, Python for ML inference",
-	}
+func analyzeDirectories(outettsDir string, report *CleanupReport) {
+	report.RemovedDirs = appendExisting(report.RemovedDirs, outettsDir, removableDirs)
+	report.KeptDirs = appendExisting(report.KeptDirs, outettsDir, essentialDirs)
 }
 
 // AnalyzeOuteTTSCleanup analyzes the OuteTTS directory structure and generates
@@ -196,97 +167,40 @@ func AnalyzeOuteTTSCleanup(outettsDir string) (*CleanupReport, error) {
 	analyzeFiles(outettsDir, report)
 	analyzeDirectories(outettsDir, report)
 
-	report.Recommendations = generateRecommendations()
+	// Reports are handed to callers, so they get their own copy of the table.
+	report.Recommendations = slices.Clone(recommendations)
 
 	return report, nil
 }
 
-// formatFileSection formats a file section for the cleanup report.
-func formatFileSection(title string, files []string) string {
-	if len(files) == 0 {
-		return ""
-	}
-
-	var result strings.Builder
-	result.WriteString(title)
-	result.WriteString("\n")
-
-	for _, file := range files {
-		result.WriteString(fmt.Sprintf(listItemFormat, file))
-	}
-
-	result.WriteString("\n")
-
-	return result.String()
-}
-
-func formatDirectorySection(title string, dirs []string) string {
-	if len(dirs) == 0 {
-		return ""
+// writeListSection appends a titled list section to the cleanup report. Items
+// are written straight into the shared builder, so no per-line or per-section
+// strings are allocated.
+func writeListSection(result *strings.Builder, title string, items []string) {
+	if len(items) == 0 {
+		return
 	}
 
-	var result strings.Builder
 	result.WriteString(title)
 	result.WriteString("\n")
 
-	for _, dir := range dirs {
-		result.WriteString(fmt.Sprintf(listItemFormat, dir))
-	}
-
-	result.WriteString("\n")
-
-	return result.String()
-}
-
-func formatRecommendationsSection(recommendations []string) string {
-	if len(recommendations) == 0 {
-		return ""
-	}
-
-	var result strings.Builder
-	result.WriteString(reportRecommendations)
-	result.WriteString("\n")
-
-	for _, rec := range recommendations {
-		result.WriteString(fmt.Sprintf(listItemFormat, rec))
+	for _, item := range items {
+		result.WriteString(listItemPrefix)
+		result.WriteString(item)
+		result.WriteString("\n")
 	}
 
 	result.WriteString("\n")
-
-	return result.String()
 }
 
-func formatErrorsSection(errorList []string) string {
-	if len(errorList) == 0 {
-		return ""
-	}
-
-	var result strings.Builder
-	result.WriteString(reportErrors)
-	result.WriteString("\n")
-
-	for _, errorItem := range errorList {
-		result.WriteString(fmt.Sprintf(listItemFormat, errorItem))
-	}
-
-	result.WriteString("\n")
-
-	return result.String()
-}
-
-func formatSummarySection(report *CleanupReport) string {
-	var result strings.Builder
+func writeSummarySection(result *strings.Builder, report *CleanupReport) {
 	result.WriteString(reportHeaderSummary)
 	result.WriteString("\n")
-	result.WriteString(fmt.Sprintf(summaryFilesToRemove, len(report.RemovedFiles)))
-	result.WriteString(fmt.Sprintf(summaryDirsToRemove, len(report.RemovedDirs)))
-	result.WriteString(fmt.Sprintf(summaryFilesToKeep, len(report.KeptFiles)))
-	result.WriteString(fmt.Sprintf(summaryDirsToKeep, len(report.KeptDirs)))
-	result.WriteString(
-		fmt.Sprintf(summaryRecommendations, len(report.Recommendations)),
-	)
-
-	return result.String()
+	fmt.Fprintf(result, summaryFilesToRemove, len(report.RemovedFiles))
+	fmt.Fprintf(result, summaryDirsToRemove, len(report.RemovedDirs))
+	fmt.Fprintf(result, summaryFilesToKeep, len(report.KeptFiles))
+	fmt.Fprintf(result, summaryDirsToKeep, len(report.KeptDirs))
+	fmt.Fprintf(result, summaryRecommendations, len(report.Recommendations))
 }
 
 // FormatCleanupReport formats a cleanup report as a string.
@@ -296,36 +210,28 @@ func FormatCleanupReport(report *CleanupReport) string {
 	result.WriteString(reportHeaderAnalysis)
 	result.WriteString("\n\n")
 
-	result.WriteString(formatFileSection(reportFilesRemoved, report.RemovedFiles))
-	result.WriteString(formatDirectorySection(reportDirsRemoved, report.RemovedDirs))
-	result.WriteString(formatFileSection(reportFilesKept, report.KeptFiles))
-	result.WriteString(formatDirectorySection(reportDirsKept, report.KeptDirs))
-	result.WriteString(formatRecommendationsSection(report.Recommendations))
-	result.WriteString(formatErrorsSection(report.Errors))
-	result.WriteString(formatSummarySection(report))
+	writeListSection(&result, reportFilesRemoved, report.RemovedFiles)
+	writeListSection(&result, reportDirsRemoved, report.RemovedDirs)
+	writeListSection(&result, reportFilesKept, report.KeptFiles)
+	writeListSection(&result, reportDirsKept, report.KeptDirs)
+	writeListSection(&result, reportRecommendations, report.Recommendations)
+	writeListSection(&result, reportErrors, report.Errors)
+	writeSummarySection(&result, report)
 
 	return result.String()
 }
 
 // GetGoReplacements returns a map of Python files to their Go replacements.
+// The returned map is a copy that callers may modify.
 func GetGoReplacements() map[string]string {
-	return map[string]string{
-		"utils/chunking.py":      "internal/chunking/chunking.go",
-		"utils/preprocessing.py": "internal/tts/text/preprocessing.go",
-		"utils/helpers.py":       "internal/tts/utils/helpers.go",
-		"anyascii/__init__.py":   "internal/tts/text/anyascii.go",
-		"whisper/transcribe.py":  "internal/tts/whisper/client.go",
-		"models/config.py":       "internal/tts/config/config.go",
-	}
+	return maps.Clone(goReplacements)
 }
 
 // ValidateGoImplementation checks if Go replacements exist.
 func ValidateGoImplementation() error {
-	replacements := GetGoReplacements()
-
 	var missing []string
 
-	for pythonFile, goFile := range replacements {
+	for pythonFile, goFile := range goReplacements {
 		_, err := os.Stat(goFile)
 		if os.IsNotExist(err) {
 			missing = append(
@@ -0,0 +1,112 @@
+// Package tts_test tests the OuteTTS cleanup analysis and report.
+package tts_test
+
+import (
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/book-expert/tts-service/internal/tts"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// expectedCleanupReport is the golden output for the layout created by
+// newOuteTTSLayout.
+const expectedCleanupReport = `=== OuteTTS Cleanup Analysis ===
+
+🗑️ Files that can be removed (replaced by Go):
+  - utils/chunking.py
+  - whisper/transcribe.py
+
+🗑️ Directories that can be removed:
+  - anyascii/_data
+
+✅ Essential files to keep (ML functionality):
+  - interface.py
+  - models/config.py
+
+✅ Essential directories to keep:
+  - dac
+  - models
+
+💡 Recommendations:
+  - Text chunking has been replaced by Go implementation in internal/chunking/
+  - Text preprocessing can be implemented in Go using regex and unicode packages
+  - AnyASCII conversion can be pure Go using unicode normalization
+  - Whisper integration can use Go HTTP client for API calls
+  - Configuration management is now handled by Go structs
+  - Audio file operations can use Go audio libraries
+  - Keep core ML components (DAC, model loading, inference) in Python
+  - Use Go for orchestration, Python for ML inference
+
+=== Summary ===
+Files to remove: 2
+Dirs to remove: 1
+Files to keep: 2
+Dirs to keep: 2
+Recommendations: 8
+`
+
+// newOuteTTSLayout creates a partial OuteTTS checkout and returns its root.
+func newOuteTTSLayout(t *testing.T) string {
+	t.Helper()
+
+	root := t.TempDir()
+
+	for _, dir := range []string{"utils", "whisper", "anyascii/_data", "dac", "models"} {
+		require.NoError(t, os.MkdirAll(filepath.Join(root, dir), 0o750))
+	}
+
+	for _, file := range []string{"utils/chunking.py", "whisper/transcribe.py", "interface.py", "models/config.py"} {
+		require.NoError(t, os.WriteFile(filepath.Join(root, file), nil, 0o600))
+	}
+
+	return root
+}
+
+func TestFormatCleanupReport(t *testing.T) {
+	t.Parallel()
+
+	report, err := tts.AnalyzeOuteTTSCleanup(newOuteTTSLayout(t))
+	require.NoError(t, err)
+
+	assert.Equal(t, expectedCleanupReport, tts.FormatCleanupReport(report))
+}
+
+func TestFormatCleanupReport_Errors(t *testing.T) {
+	t.Parallel()
+
+	report := &tts.CleanupReport{
+		RemovedFiles:    nil,
+		RemovedDirs:     nil,
+		KeptFiles:       nil,
+		KeptDirs:        nil,
+		Recommendations: nil,
+		Errors:          []string{"permission denied"},
+	}
+
+	expected := "=== OuteTTS Cleanup Analysis ===\n\n" +
+		"❌ Errors encountered:\n  - permission denied\n\n" +
+		"=== Summary ===\n" +
+		"Files to remove: 0\nDirs to remove: 0\nFiles to keep: 0\nDirs to keep: 0\nRecommendations: 0\n"
+
+	assert.Equal(t, expected, tts.FormatCleanupReport(report))
+}
+
+func TestAnalyzeOuteTTSCleanup_ReturnsIndependentReports(t *testing.T) {
+	t.Parallel()
+
+	root := newOuteTTSLayout(t)
+
+	first, err := tts.AnalyzeOuteTTSCleanup(root)
+	require.NoError(t, err)
+
+	first.Recommendations[0] = "changed"
+
+	second, err := tts.AnalyzeOuteTTSCleanup(root)
+	require.NoError(t, err)
+
+	assert.NotEqual(t, "changed", second.Recommendations[0])
+	assert.Equal(t, expectedCleanupReport, tts.FormatCleanupReport(second))
+}
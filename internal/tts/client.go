@@ -37,6 +37,21 @@ const (
 	defaultLanguage    = "en"
 )
 
+// Connection pooling. Requests all target the same TTS host, so keep enough
+// idle keep-alive connections to reuse one per concurrent caller instead of
+// the default of two, and drop them after the server's keep-alive window.
+const (
+	maxIdleConnsPerHost = 16
+	idleConnTimeout     = 30 * time.Second
+)
+
+// maxErrorBodyBytes bounds how much of an error response is read for diagnostics.
+const maxErrorBodyBytes = 64 * 1024
+
+// maxPreallocAudioBytes caps how much memory a declared Content-Length may
+// reserve up front; larger responses are read without preallocation.
+const maxPreallocAudioBytes = 256 << 20
+
 // Static errors.
 var (
 	ErrTextCannotBeEmpty     = errors.New("text cannot be empty")
@@ -115,11 +130,24 @@ type ErrorResponse struct {
 // NewHTTPClient creates and configures an HTTP client for the TTS service.
 // The baseURL should include the protocol and port (e.g., "http://localhost:8000").
 // The timeout applies to all HTTP requests made by this client.
+// Connections are kept alive and pooled per host so repeated requests skip
+// the TCP handshake.
 func NewHTTPClient(baseURL string, timeout time.Duration) *HTTPClient {
+	transport, ok := http.DefaultTransport.(*http.Transport)
+	if ok {
+		transport = transport.Clone()
+	} else {
+		transport = &http.Transport{} //nolint:exhaustruct // zero value is the documented default
+	}
+
+	transport.MaxIdleConns = maxIdleConnsPerHost
+	transport.MaxIdleConnsPerHost = maxIdleConnsPerHost
+	transport.IdleConnTimeout = idleConnTimeout
+
 	return &HTTPClient{
 		baseURL: baseURL,
 		httpClient: &http.Client{
-			Transport:     nil,
+			Transport:     transport,
 			CheckRedirect: nil,
 			Jar:           nil,
 			Timeout:       timeout,
@@ -280,7 +308,22 @@ func (c *HTTPClient) validateResponseContentType(resp *http.Response) error {
 }
 
 // readAudioData reads and validates the audio response data.
+//
+// When the service frames the response with a Content-Length, the buffer is
+// allocated at its exact size and filled in one pass instead of being grown
+// and copied as io.ReadAll discovers the length.
 func (c *HTTPClient) readAudioData(resp *http.Response) ([]byte, error) {
+	if resp.ContentLength > 0 && resp.ContentLength <= maxPreallocAudioBytes {
+		audioData := make([]byte, resp.ContentLength)
+
+		_, err := io.ReadFull(resp.Body, audioData)
+		if err != nil {
+			return nil, fmt.Errorf("failed to read audio data: %w", err)
+		}
+
+		return audioData, nil
+	}
+
 	audioData, err := io.ReadAll(resp.Body)
 	if err != nil {
 		return nil, fmt.Errorf("failed to read audio data: %w", err)
@@ -296,10 +339,18 @@ func (c *HTTPClient) readAudioData(resp *http.Response) ([]byte, error) {
 // parseErrorResponse attempts to decode a structured JSON error from the service.
 // If structured parsing fails, it falls back to returning the raw response body
 // to ensure diagnostic information is preserved.
+//
+// The body is read once and decoded from memory, so the fallback reports the
+// same bytes the decoder saw instead of whatever the decoder left unread.
 func (c *HTTPClient) parseErrorResponse(resp *http.Response) error {
+	body, readErr := io.ReadAll(io.LimitReader(resp.Body, maxErrorBodyBytes))
+	if readErr != nil {
+		return fmt.Errorf("failed to read error response body: %w", readErr)
+	}
+
 	var errorResp ErrorResponse
 
-	err := json.NewDecoder(resp.Body).Decode(&errorResp)
+	err := json.Unmarshal(body, &errorResp)
 	if err == nil {
 		return newServiceErrorWithCodeError(
 			resp.Status,
@@ -309,10 +360,5 @@ func (c *HTTPClient) parseErrorResponse(resp *http.Response) error {
 	}
 
 	// Fallback to raw response for non-JSON errors
-	body, readErr := io.ReadAll(resp.Body)
-	if readErr != nil {
-		return fmt.Errorf("failed to read error response body: %w", readErr)
-	}
-
 	return newServiceNonOKStatusError(resp.Status, string(body))
 }
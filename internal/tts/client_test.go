@@ -0,0 +1,114 @@
+// Package tts_test tests the HTTP client for the standalone TTS service.
+package tts_test
+
+import (
+	"context"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+	"time"
+
+	"github.com/book-expert/tts-service/internal/tts"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestHTTPClient_GenerateSpeech(t *testing.T) {
+	t.Parallel()
+
+	audio := []byte("RIFF-fake-wav-payload")
+
+	tests := []struct {
+		name    string
+		chunked bool
+	}{
+		{name: "content length", chunked: false},
+		{name: "chunked", chunked: true},
+	}
+
+	for _, testCase := range tests {
+		t.Run(testCase.name, func(t *testing.T) {
+			t.Parallel()
+
+			server := httptest.NewServer(http.HandlerFunc(func(writer http.ResponseWriter, _ *http.Request) {
+				writer.Header().Set("Content-Type", "audio/wav")
+
+				if testCase.chunked {
+					// Flushing before the body forces chunked encoding.
+					flusher, ok := writer.(http.Flusher)
+					assert.True(t, ok)
+					flusher.Flush()
+				}
+
+				_, err := writer.Write(audio)
+				assert.NoError(t, err)
+			}))
+			t.Cleanup(server.Close)
+
+			client := tts.NewHTTPClient(server.URL, 5*time.Second)
+
+			audioData, err := client.GenerateSpeech(context.Background(), tts.Request{
+				Text:           "hello",
+				SpeakerRefPath: "",
+				Language:       "",
+				Temperature:    0,
+			})
+			require.NoError(t, err)
+
+			assert.Equal(t, audio, audioData)
+		})
+	}
+}
+
+func TestHTTPClient_GenerateSpeechErrorResponses(t *testing.T) {
+	t.Parallel()
+
+	testCases := []struct {
+		name        string
+		contentType string
+		body        string
+		wantErr     error
+		wantText    string
+	}{
+		{
+			name:        "structured JSON error",
+			contentType: "application/json",
+			body:        `{"detail":"speaker not found","errorCode":"BAD_SPEAKER"}`,
+			wantErr:     tts.ErrServiceError,
+			wantText:    "speaker not found (code: BAD_SPEAKER)",
+		},
+		{
+			name:        "plain text error",
+			contentType: "text/plain",
+			body:        "model crashed",
+			wantErr:     tts.ErrServiceNonOKStatus,
+			wantText:    "body: model crashed",
+		},
+	}
+
+	for _, testCase := range testCases {
+		t.Run(testCase.name, func(t *testing.T) {
+			t.Parallel()
+
+			server := httptest.NewServer(http.HandlerFunc(func(writer http.ResponseWriter, _ *http.Request) {
+				writer.Header().Set("Content-Type", testCase.contentType)
+				writer.WriteHeader(http.StatusInternalServerError)
+
+				_, err := writer.Write([]byte(testCase.body))
+				assert.NoError(t, err)
+			}))
+			t.Cleanup(server.Close)
+
+			client := tts.NewHTTPClient(server.URL, 5*time.Second)
+
+			_, err := client.GenerateSpeech(context.Background(), tts.Request{
+				Text:           "hello",
+				SpeakerRefPath: "",
+				Language:       "",
+				Temperature:    0,
+			})
+			require.ErrorIs(t, err, testCase.wantErr)
+			assert.Contains(t, err.Error(), testCase.wantText)
+		})
+	}
+}
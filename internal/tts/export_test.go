@@ -0,0 +1,4 @@
+package tts
+
+// ModelQuantization exposes modelQuantization to the external tests.
+var ModelQuantization = modelQuantization
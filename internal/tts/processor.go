@@ -2,46 +2,291 @@
 package tts
 
 import (
+	"bytes"
 	"context"
 	"errors"
 	"fmt"
+	"io"
 	"os"
 	"os/exec"
+	"path/filepath"
+	"regexp"
+	"runtime"
 	"strconv"
+	"strings"
+	"sync"
+	"syscall"
+	"time"
 
 	"github.com/book-expert/logger"
 	"github.com/book-expert/tts-service/internal/core"
 )
 
-// ErrNotImplemented is returned when a method is not yet implemented.
-var ErrNotImplemented = errors.New("not yet implemented")
+// sharedMemoryDir is a RAM-backed tmpfs mount available on most Linux systems.
+// Staging chatllm's WAV export there keeps the per-request round-trip off disk.
+const sharedMemoryDir = "/dev/shm"
+
+// chatllmBinary is the name of the chatllm executable looked up on PATH.
+const chatllmBinary = "chatllm"
+
+// chatllmWaitDelay bounds how long Process waits for chatllm's output pipes to
+// close after the process group has been killed on cancellation.
+const chatllmWaitDelay = 5 * time.Second
+
+// maxPooledOutputBytes is the largest chatllm output buffer kept for reuse;
+// buffers that grew beyond it after an unusually chatty run are released.
+const maxPooledOutputBytes = 1 << 20
+
+// outputBufferPool recycles the buffers that capture chatllm's console output.
+// The output is only inspected when a run fails, so successful runs hand the
+// same buffer to the next job instead of allocating a fresh one each time.
+var outputBufferPool = sync.Pool{
+	New: func() any { return new(bytes.Buffer) },
+}
+
+// perJobArgCount is the number of chatllm arguments formatted for each job.
+const perJobArgCount = 14
+
+// warmupReadSize is the buffer size Warmup reads the model files with.
+const warmupReadSize = 1 << 20
+
+// maxDefaultThreads caps the auto-detected chatllm thread count; beyond this,
+// extra threads mostly contend for memory bandwidth during decoding.
+const maxDefaultThreads = 16
+
+// quantizationPattern extracts the weight type tag (e.g. "q8_0", "q4_k_m",
+// "q4_0_4_4", "iq4_xs", "f16") that chatllm's convert.py and llama.cpp embed
+// in model file names.
+var quantizationPattern = regexp.MustCompile(
+	`(?i)(?:^|[-._])((?:i?q|tq)[1-8](?:_[0-9a-z]+)*|bf16|f16|f32)(?:[-._]|$)`,
+)
 
 // ChatLLMProcessor implements the core.TTSProcessor interface by calling the chatllm binary.
 type ChatLLMProcessor struct {
-	config core.TTSConfig
-	log    *logger.Logger
+	config     core.TTSConfig
+	log        *logger.Logger
+	scratchDir string
+	binaryPath string
+	staticArgs []string
+	env        []string
 }
 
 // New creates a new ChatLLMProcessor.
 func New(cfg core.TTSConfig, log *logger.Logger) (*ChatLLMProcessor, error) {
+	logModelQuantization(cfg.ModelPath, log)
+	checkModelFiles(cfg, log)
+
+	threads := resolveThreads(cfg.Threads)
+
 	return &ChatLLMProcessor{
-		config: cfg,
-		log:    log,
+		config:     cfg,
+		log:        log,
+		scratchDir: resolveScratchDir(),
+		binaryPath: resolveBinaryPath(log),
+		staticArgs: buildStaticArgs(cfg, threads),
+		env:        buildEnv(threads),
 	}, nil
 }
 
+// resolveScratchDir picks the directory used for chatllm's temporary WAV export,
+// preferring the in-memory tmpfs and falling back to the default temp directory.
+// Exports staged in RAM never touch the page cache of a real disk and their
+// memory is released as soon as the file is removed.
+//
+// The tmpfs is probed with a real file because containers often mount
+// /dev/shm read-only or leave it unwritable; a directory that merely exists
+// would otherwise make every job fail in CreateTemp.
+func resolveScratchDir() string {
+	probe, err := os.CreateTemp(sharedMemoryDir, "tts-probe-*")
+	if err != nil {
+		return os.TempDir()
+	}
+
+	closeErr := probe.Close()
+	removeErr := os.Remove(probe.Name())
+
+	if closeErr != nil || removeErr != nil {
+		return os.TempDir()
+	}
+
+	return sharedMemoryDir
+}
+
+// resolveBinaryPath looks up the chatllm executable once so that each job does
+// not repeat the PATH search. If it cannot be found, the bare name is kept and
+// the error surfaces when a job runs.
+func resolveBinaryPath(log *logger.Logger) string {
+	path, err := exec.LookPath(chatllmBinary)
+	if err != nil {
+		log.Warn("Could not find '%s' on PATH: %v", chatllmBinary, err)
+
+		return chatllmBinary
+	}
+
+	return path
+}
+
+// checkModelFiles warns at startup about configured model files that do not
+// exist, since the paths are fixed for the lifetime of the processor.
+func checkModelFiles(cfg core.TTSConfig, log *logger.Logger) {
+	for _, modelPath := range []string{cfg.ModelPath, cfg.SnacModelPath} {
+		if modelPath == "" {
+			continue
+		}
+
+		_, statErr := os.Stat(modelPath)
+		if statErr != nil {
+			log.Warn("Model file '%s' is not accessible: %v", modelPath, statErr)
+		}
+	}
+}
+
+// logModelQuantization reports the weight type of the configured model and
+// warns when it is not quantized. Decoding is memory-bandwidth bound, so an
+// 8-bit or 4-bit model is roughly twice as fast as a 16-bit one.
+func logModelQuantization(modelPath string, log *logger.Logger) {
+	if modelPath == "" {
+		return
+	}
+
+	quantization := modelQuantization(modelPath)
+	if quantization == "" {
+		log.Warn("Could not determine quantization of model '%s'; "+
+			"a q8_0 or q4_k_m model is recommended", modelPath)
+
+		return
+	}
+
+	if strings.HasPrefix(quantization, "f") || strings.HasPrefix(quantization, "bf") {
+		log.Warn("Model '%s' uses unquantized %s weights; "+
+			"convert it to q8_0 or q4_k_m for faster synthesis", modelPath, quantization)
+
+		return
+	}
+
+	log.Info("Using %s quantized model '%s'", quantization, modelPath)
+}
+
+// modelQuantization returns the lower-cased weight type tag in the model file
+// name, or an empty string when the name carries none.
+func modelQuantization(modelPath string) string {
+	match := quantizationPattern.FindStringSubmatch(filepath.Base(modelPath))
+	if match == nil {
+		return ""
+	}
+
+	return strings.ToLower(match[1])
+}
+
+// buildStaticArgs assembles the chatllm arguments that are fixed for the
+// lifetime of the processor (model files and engine tuning), so each job only
+// formats its own prompt and sampling flags.
+func buildStaticArgs(cfg core.TTSConfig, threads int) []string {
+	args := []string{
+		"-m", cfg.ModelPath,
+		"--snac_model", cfg.SnacModelPath,
+		"--threads", strconv.Itoa(threads),
+	}
+
+	if cfg.BatchSize > 0 {
+		args = append(args, "--batch_size", strconv.Itoa(cfg.BatchSize))
+	}
+
+	if cfg.CacheDType != "" {
+		args = append(args, "--cache_dtype", cfg.CacheDType)
+	}
+
+	return args
+}
+
+// buildEnv snapshots the service environment once, with chatllm's OpenMP
+// runtime pinned to threads, so jobs do not copy the environment on every run.
+// exec.Cmd only reads Env, so the slice is shared by all runs.
+func buildEnv(threads int) []string {
+	return append(os.Environ(), "OMP_NUM_THREADS="+strconv.Itoa(threads))
+}
+
+// resolveThreads returns the configured thread count, or the number of CPU
+// cores capped at maxDefaultThreads when none is configured.
+func resolveThreads(configured int) int {
+	if configured > 0 {
+		return configured
+	}
+
+	return min(runtime.NumCPU(), maxDefaultThreads)
+}
+
 // GetConfig returns the TTS configuration.
 func (p *ChatLLMProcessor) GetConfig() core.TTSConfig {
 	return p.config
 }
 
+// Warmup reads the configured model files once, sequentially, so the first
+// job's chatllm process loads them from the OS page cache instead of cold from
+// disk. Every job starts a new process, so no other state can be warmed from
+// here. Unset paths are skipped.
+func (p *ChatLLMProcessor) Warmup(ctx context.Context) error {
+	buffer := make([]byte, warmupReadSize)
+
+	for _, modelPath := range []string{p.config.ModelPath, p.config.SnacModelPath} {
+		if modelPath == "" {
+			continue
+		}
+
+		err := p.readWholeFile(ctx, modelPath, buffer)
+		if err != nil {
+			return err
+		}
+	}
+
+	return nil
+}
+
+// readWholeFile reads path to the end through buffer, discarding the data. It
+// stops early when ctx is cancelled.
+func (p *ChatLLMProcessor) readWholeFile(ctx context.Context, path string, buffer []byte) error {
+	file, err := os.Open(path) // #nosec G304 -- path is the operator-configured model file
+	if err != nil {
+		return fmt.Errorf("failed to open model file '%s': %w", path, err)
+	}
+
+	defer func() {
+		closeErr := file.Close()
+		if closeErr != nil {
+			p.log.Warn("Failed to close model file '%s': %v", path, closeErr)
+		}
+	}()
+
+	for {
+		ctxErr := ctx.Err()
+		if ctxErr != nil {
+			return fmt.Errorf("reading model file '%s' interrupted: %w", path, ctxErr)
+		}
+
+		_, readErr := file.Read(buffer)
+		if errors.Is(readErr, io.EOF) {
+			return nil
+		}
+
+		if readErr != nil {
+			return fmt.Errorf("failed to read model file '%s': %w", path, readErr)
+		}
+	}
+}
+
 // Process takes text and returns the raw audio data by calling the chatllm binary.
 func (p *ChatLLMProcessor) Process(ctx context.Context, text []byte, cfg core.TTSConfig) ([]byte, error) {
-	tempFile, err := os.CreateTemp("", "tts-output-*.wav")
+	tempFile, err := os.CreateTemp(p.scratchDir, "tts-output-*.wav")
 	if err != nil {
 		return nil, fmt.Errorf("failed to create temp file for tts output: %w", err)
 	}
 
+	// chatllm writes the export by path; only the name is needed from here on.
+	closeErr := tempFile.Close()
+	if closeErr != nil {
+		p.log.Warn("Failed to close temp file '%s': %v", tempFile.Name(), closeErr)
+	}
+
 	defer func() {
 		removeErr := os.Remove(tempFile.Name())
 		if removeErr != nil {
@@ -49,24 +294,31 @@ func (p *ChatLLMProcessor) Process(ctx context.Context, text []byte, cfg core.TT
 		}
 	}()
 
-	args := []string{
-		"-m", p.config.ModelPath,
-		"--snac_model", p.config.SnacModelPath,
-		"-p", fmt.Sprintf("{%s}: %s", cfg.Voice, string(text)),
+	args := make([]string, 0, len(p.staticArgs)+perJobArgCount)
+	args = append(args, p.staticArgs...)
+	args = append(args,
+		"-p", buildPrompt(cfg.Voice, text),
 		"--tts_export", tempFile.Name(),
 		"--seed", strconv.Itoa(cfg.Seed),
 		"-ngl", strconv.Itoa(cfg.NGL),
-		"--top_p", fmt.Sprintf("%.2f", cfg.TopP),
-		"--repetition_penalty", fmt.Sprintf("%.2f", cfg.RepetitionPenalty),
-		"--temp", fmt.Sprintf("%.2f", cfg.Temperature),
-	}
+		"--top_p", strconv.FormatFloat(cfg.TopP, 'f', 2, 64),
+		"--repetition_penalty", strconv.FormatFloat(cfg.RepetitionPenalty, 'f', 2, 64),
+		"--temp", strconv.FormatFloat(cfg.Temperature, 'f', 2, 64),
+	)
 
 	// #nosec G204 -- arguments are validated via core.TTSConfig validation
-	cmd := exec.CommandContext(ctx, "chatllm", args...)
+	cmd := exec.CommandContext(ctx, p.binaryPath, args...)
+	p.isolateCommand(cmd)
 
-	output, err := cmd.CombinedOutput()
+	output, _ := outputBufferPool.Get().(*bytes.Buffer)
+	defer releaseOutputBuffer(output)
+
+	cmd.Stdout = output
+	cmd.Stderr = output
+
+	err = cmd.Run()
 	if err != nil {
-		return nil, fmt.Errorf("chatllm binary execution failed: %w - output: %s", err, string(output))
+		return nil, fmt.Errorf("chatllm binary execution failed: %w - output: %s", err, output.String())
 	}
 
 	audioData, err := os.ReadFile(tempFile.Name())
@@ -74,5 +326,50 @@ func (p *ChatLLMProcessor) Process(ctx context.Context, text []byte, cfg core.TT
 		return nil, fmt.Errorf("failed to read audio data from temp file: %w", err)
 	}
 
+	info, err := ParseWAVInfo(audioData)
+	if err != nil {
+		return nil, err
+	}
+
+	p.log.Info("chatllm produced %s of audio (%d Hz, %d-bit, %d channel(s))",
+		info.Duration, info.SampleRate, info.BitsPerSample, info.Channels)
+
 	return audioData, nil
 }
+
+// releaseOutputBuffer returns a console output buffer to the pool unless it has
+// grown too large to be worth keeping.
+func releaseOutputBuffer(output *bytes.Buffer) {
+	if output.Cap() > maxPooledOutputBytes {
+		return
+	}
+
+	output.Reset()
+	outputBufferPool.Put(output)
+}
+
+// buildPrompt prepends the "{voice}: " speaker tag chatllm expects to text in
+// a single allocation.
+func buildPrompt(voice string, text []byte) string {
+	var prompt strings.Builder
+	prompt.Grow(len(voice) + len("{}: ") + len(text))
+	prompt.WriteString("{")
+	prompt.WriteString(voice)
+	prompt.WriteString("}: ")
+	prompt.Write(text)
+
+	return prompt.String()
+}
+
+// isolateCommand runs chatllm as a separate engine process: it gets its own
+// process group, so terminal signals aimed at the service do not reach it and
+// cancellation kills any helpers it spawned, and its OpenMP runtime is pinned
+// to the configured thread count instead of claiming every core.
+func (p *ChatLLMProcessor) isolateCommand(cmd *exec.Cmd) {
+	cmd.Env = p.env
+	cmd.SysProcAttr = &syscall.SysProcAttr{Setpgid: true} //nolint:exhaustruct // only the process group is set
+	cmd.Cancel = func() error {
+		return syscall.Kill(-cmd.Process.Pid, syscall.SIGKILL)
+	}
+	cmd.WaitDelay = chatllmWaitDelay
+}
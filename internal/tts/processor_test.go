@@ -3,11 +3,14 @@ package tts_test
 
 import (
 	"context"
+	"os"
+	"path/filepath"
 	"testing"
 
 	"github.com/book-expert/logger"
 	"github.com/book-expert/tts-service/internal/core"
 	"github.com/book-expert/tts-service/internal/tts"
+	"github.com/stretchr/testify/assert"
 	"github.com/stretchr/testify/require"
 )
 
@@ -23,6 +26,9 @@ func TestNewChatLLMProcessor(t *testing.T) {
 		TopP:              0,
 		RepetitionPenalty: 0,
 		Temperature:       0,
+		Threads:           0,
+		BatchSize:         0,
+		CacheDType:        "",
 	}
 	testLogger, err := logger.New("/tmp", "test-log.log")
 	require.NoError(t, err)
@@ -43,6 +49,9 @@ func TestChatLLMProcessor_Process(t *testing.T) {
 		TopP:              0,
 		RepetitionPenalty: 0,
 		Temperature:       0,
+		Threads:           0,
+		BatchSize:         0,
+		CacheDType:        "",
 	}
 	testLogger, err := logger.New("/tmp", "test-log.log")
 	require.NoError(t, err)
@@ -61,6 +70,91 @@ func TestChatLLMProcessor_Process(t *testing.T) {
 		TopP:              0,
 		RepetitionPenalty: 0,
 		Temperature:       0,
+		Threads:           0,
+		BatchSize:         0,
+		CacheDType:        "",
 	})
 	require.Error(t, err)
 }
+
+func TestChatLLMProcessor_Warmup(t *testing.T) {
+	t.Parallel()
+
+	modelPath := filepath.Join(t.TempDir(), "model.q8_0.bin")
+	require.NoError(t, os.WriteFile(modelPath, make([]byte, 3<<20), 0o600))
+
+	cancelledCtx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	testCases := []struct {
+		name      string
+		ctx       context.Context //nolint:containedctx // per-case input
+		modelPath string
+		wantErr   bool
+	}{
+		{name: "reads model file", ctx: context.Background(), modelPath: modelPath, wantErr: false},
+		{name: "skips unset paths", ctx: context.Background(), modelPath: "", wantErr: false},
+		{name: "missing model file", ctx: context.Background(), modelPath: modelPath + ".missing", wantErr: true},
+		{name: "cancelled", ctx: cancelledCtx, modelPath: modelPath, wantErr: true},
+	}
+
+	for _, testCase := range testCases {
+		t.Run(testCase.name, func(t *testing.T) {
+			t.Parallel()
+
+			testLogger, err := logger.New("/tmp", "test-log.log")
+			require.NoError(t, err)
+
+			processor, err := tts.New(core.TTSConfig{
+				ModelPath:         testCase.modelPath,
+				SnacModelPath:     "",
+				Voice:             "",
+				Seed:              0,
+				NGL:               0,
+				TopP:              0,
+				RepetitionPenalty: 0,
+				Temperature:       0,
+				Threads:           0,
+				BatchSize:         0,
+				CacheDType:        "",
+			}, testLogger)
+			require.NoError(t, err)
+
+			err = processor.Warmup(testCase.ctx)
+			if testCase.wantErr {
+				require.Error(t, err)
+
+				return
+			}
+
+			require.NoError(t, err)
+		})
+	}
+}
+
+func TestModelQuantization(t *testing.T) {
+	t.Parallel()
+
+	testCases := []struct {
+		modelPath string
+		expected  string
+	}{
+		{modelPath: "/models/outetts.q8_0.bin", expected: "q8_0"},
+		{modelPath: "outetts-Q4_K_M.gguf", expected: "q4_k_m"},
+		{modelPath: "m.q4_0_4_4.gguf", expected: "q4_0_4_4"},
+		{modelPath: "model-iq4_xs.gguf", expected: "iq4_xs"},
+		{modelPath: "model_iq2_xxs.gguf", expected: "iq2_xxs"},
+		{modelPath: "snac.f16.bin", expected: "f16"},
+		{modelPath: "model-BF16.gguf", expected: "bf16"},
+		{modelPath: "/models/outetts.bin", expected: ""},
+		{modelPath: "qwen2.5-0.5b.bin", expected: ""},
+	}
+
+	for _, testCase := range testCases {
+		t.Run(testCase.modelPath, func(t *testing.T) {
+			t.Parallel()
+
+			assert.Equal(t, testCase.expected, tts.ModelQuantization(testCase.modelPath))
+		})
+	}
+}
@@ -0,0 +1,130 @@
+// Package tts provides TTS (Text-to-Speech) functionality.
+package tts
+
+import (
+	"bytes"
+	"encoding/binary"
+	"errors"
+	"fmt"
+	"time"
+)
+
+// ErrInvalidAudio is returned when chatllm exits successfully but its export is
+// not a RIFF/WAVE file.
+var ErrInvalidAudio = errors.New("chatllm output is not a valid WAV file")
+
+// WAV header layout. chatllm always exports canonical PCM WAV, so the output
+// is read directly from the fixed RIFF/WAVE header instead of being decoded.
+const (
+	wavHeaderSize      = 44
+	wavRIFFOffset      = 0
+	wavWAVEOffset      = 8
+	wavFmtOffset       = 12
+	wavMagicFieldLen   = 4
+	wavChunkHeaderSize = 8
+	wavMinFmtSize      = 16
+
+	// Offsets of the format fields within the canonical "fmt " chunk.
+	wavChannelsOffset      = 22
+	wavSampleRateOffset    = 24
+	wavByteRateOffset      = 28
+	wavBitsPerSampleOffset = 34
+)
+
+var (
+	wavRIFFMagic = []byte("RIFF")
+	wavWAVEMagic = []byte("WAVE")
+	wavFmtMagic  = []byte("fmt ")
+	wavDataMagic = []byte("data")
+)
+
+// WAVInfo describes the format and length of a PCM WAV payload.
+type WAVInfo struct {
+	SampleRate    int
+	Channels      int
+	BitsPerSample int
+	DataBytes     int
+	Duration      time.Duration
+}
+
+// ParseWAVInfo reads the format and duration of a WAV payload straight from its
+// header bytes. No audio is decoded and no external tool is run, so it costs a
+// few fixed-offset reads regardless of the clip length.
+func ParseWAVInfo(audioData []byte) (WAVInfo, error) {
+	err := validateWAVHeader(audioData)
+	if err != nil {
+		return WAVInfo{}, err
+	}
+
+	fmtSize := int(binary.LittleEndian.Uint32(audioData[wavFmtOffset+wavMagicFieldLen:]))
+	if fmtSize < wavMinFmtSize {
+		return WAVInfo{}, fmt.Errorf("%w: fmt chunk of %d bytes is too short", ErrInvalidAudio, fmtSize)
+	}
+
+	dataBytes, err := wavDataSize(audioData, wavFmtOffset+wavChunkHeaderSize+fmtSize)
+	if err != nil {
+		return WAVInfo{}, err
+	}
+
+	info := WAVInfo{
+		SampleRate:    int(binary.LittleEndian.Uint32(audioData[wavSampleRateOffset:])),
+		Channels:      int(binary.LittleEndian.Uint16(audioData[wavChannelsOffset:])),
+		BitsPerSample: int(binary.LittleEndian.Uint16(audioData[wavBitsPerSampleOffset:])),
+		DataBytes:     dataBytes,
+		Duration:      0,
+	}
+
+	byteRate := int(binary.LittleEndian.Uint32(audioData[wavByteRateOffset:]))
+	if byteRate > 0 {
+		info.Duration = time.Duration(dataBytes) * time.Second / time.Duration(byteRate)
+	}
+
+	return info, nil
+}
+
+// validateWAVHeader checks the fixed RIFF/WAVE/fmt markers of a canonical WAV
+// header. It catches empty or truncated exports before they are uploaded.
+func validateWAVHeader(audioData []byte) error {
+	if len(audioData) < wavHeaderSize {
+		return fmt.Errorf("%w: %d bytes is shorter than a WAV header", ErrInvalidAudio, len(audioData))
+	}
+
+	if !bytes.Equal(audioData[wavRIFFOffset:wavRIFFOffset+wavMagicFieldLen], wavRIFFMagic) ||
+		!bytes.Equal(audioData[wavWAVEOffset:wavWAVEOffset+wavMagicFieldLen], wavWAVEMagic) ||
+		!bytes.Equal(audioData[wavFmtOffset:wavFmtOffset+wavMagicFieldLen], wavFmtMagic) {
+		return fmt.Errorf("%w: missing RIFF/WAVE header", ErrInvalidAudio)
+	}
+
+	return nil
+}
+
+// wavDataSize walks the chunks that follow "fmt " until it finds the "data"
+// chunk and returns its size. A data chunk that is empty, or that declares more
+// bytes than the export contains, means chatllm produced no audio or was cut
+// off while writing it.
+func wavDataSize(audioData []byte, offset int) (int, error) {
+	for offset+wavChunkHeaderSize <= len(audioData) {
+		chunkID := audioData[offset : offset+wavMagicFieldLen]
+		chunkSize := int(binary.LittleEndian.Uint32(audioData[offset+wavMagicFieldLen:]))
+		payloadStart := offset + wavChunkHeaderSize
+
+		if bytes.Equal(chunkID, wavDataMagic) {
+			if chunkSize == 0 {
+				return 0, fmt.Errorf("%w: data chunk is empty", ErrInvalidAudio)
+			}
+
+			available := len(audioData) - payloadStart
+			if chunkSize > available {
+				return 0, fmt.Errorf("%w: data chunk declares %d bytes but only %d are present",
+					ErrInvalidAudio, chunkSize, available)
+			}
+
+			return chunkSize, nil
+		}
+
+		// Chunks are word aligned: odd-sized payloads carry one pad byte.
+		offset = payloadStart + chunkSize + chunkSize%2
+	}
+
+	return 0, fmt.Errorf("%w: no data chunk", ErrInvalidAudio)
+}
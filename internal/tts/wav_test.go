@@ -0,0 +1,81 @@
+// Package tts_test tests the WAV header parsing helpers.
+package tts_test
+
+import (
+	"encoding/binary"
+	"testing"
+	"time"
+
+	"github.com/book-expert/tts-service/internal/tts"
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+// buildWAV returns a canonical 16-bit PCM WAV with the given sample rate,
+// channel count and number of data bytes.
+func buildWAV(sampleRate, channels, dataBytes int) []byte {
+	const bitsPerSample = 16
+
+	blockAlign := channels * bitsPerSample / 8
+	header := make([]byte, 44)
+
+	copy(header[0:], "RIFF")
+	binary.LittleEndian.PutUint32(header[4:], uint32(36+dataBytes))
+	copy(header[8:], "WAVE")
+	copy(header[12:], "fmt ")
+	binary.LittleEndian.PutUint32(header[16:], 16)
+	binary.LittleEndian.PutUint16(header[20:], 1)
+	binary.LittleEndian.PutUint16(header[22:], uint16(channels))
+	binary.LittleEndian.PutUint32(header[24:], uint32(sampleRate))
+	binary.LittleEndian.PutUint32(header[28:], uint32(sampleRate*blockAlign))
+	binary.LittleEndian.PutUint16(header[32:], uint16(blockAlign))
+	binary.LittleEndian.PutUint16(header[34:], bitsPerSample)
+	copy(header[36:], "data")
+	binary.LittleEndian.PutUint32(header[40:], uint32(dataBytes))
+
+	return append(header, make([]byte, dataBytes)...)
+}
+
+func TestParseWAVInfo(t *testing.T) {
+	t.Parallel()
+
+	// One second of 24 kHz mono 16-bit audio.
+	info, err := tts.ParseWAVInfo(buildWAV(24000, 1, 48000))
+	require.NoError(t, err)
+
+	assert.Equal(t, 24000, info.SampleRate)
+	assert.Equal(t, 1, info.Channels)
+	assert.Equal(t, 16, info.BitsPerSample)
+	assert.Equal(t, 48000, info.DataBytes)
+	assert.Equal(t, time.Second, info.Duration)
+}
+
+func TestParseWAVInfo_InvalidAudio(t *testing.T) {
+	t.Parallel()
+
+	withoutData := buildWAV(24000, 1, 0)
+	copy(withoutData[36:], "LIST")
+
+	truncated := buildWAV(24000, 1, 48000)
+	truncated = truncated[:len(truncated)-1]
+
+	testCases := []struct {
+		name  string
+		audio []byte
+	}{
+		{name: "empty", audio: nil},
+		{name: "not a WAV", audio: make([]byte, 64)},
+		{name: "missing data chunk", audio: withoutData},
+		{name: "empty data chunk", audio: buildWAV(24000, 1, 0)},
+		{name: "truncated data chunk", audio: truncated},
+	}
+
+	for _, testCase := range testCases {
+		t.Run(testCase.name, func(t *testing.T) {
+			t.Parallel()
+
+			_, err := tts.ParseWAVInfo(testCase.audio)
+			require.ErrorIs(t, err, tts.ErrInvalidAudio)
+		})
+	}
+}
@@ -2,10 +2,12 @@
 package worker
 
 import (
+	"bytes"
 	"context"
 	"encoding/json"
 	"errors"
 	"fmt"
+	"sync"
 	"time"
 
 	"github.com/book-expert/events"
@@ -17,6 +19,27 @@ import (
 
 const handleMessageTimeout = 30 * time.Second
 
+// maxEventBytes caps the size of an incoming TextProcessedEvent. Events only
+// carry object keys and synthesis parameters, so anything larger is malformed
+// and is rejected before spending time decoding it.
+const maxEventBytes = 32 * 1024
+
+// drainPollInterval is how often drain checks whether NATS has finished
+// draining the job subscription.
+const drainPollInterval = 10 * time.Millisecond
+
+// maxIOWorkers bounds how many audio uploads and replies may run concurrently
+// with inference. When all slots are busy the inference loop waits, which keeps
+// finished-but-unuploaded audio from accumulating in memory.
+const maxIOWorkers = 4
+
+// replyBufferPool recycles the buffers reply events are encoded into. NATS
+// copies the payload while publishing, so a buffer can be reused as soon as
+// Respond returns.
+var replyBufferPool = sync.Pool{
+	New: func() any { return new(bytes.Buffer) },
+}
+
 var (
 	// ErrModelPathEmpty indicates that the model path is empty.
 	ErrModelPathEmpty = errors.New("model path cannot be empty")
@@ -34,8 +57,18 @@ var (
 	ErrTemperatureRange = errors.New("temperature must be >= 0.0")
 	// ErrNGLNegative indicates that the NGL (number of GPU layers) parameter is negative.
 	ErrNGLNegative = errors.New("n_gpu_layers must be non-negative")
+	// ErrEventTooLarge indicates that an incoming event exceeds maxEventBytes.
+	ErrEventTooLarge = errors.New("event payload too large")
 )
 
+// allowedVoices is the whitelist of voices accepted in TTS jobs. It is built
+// once at package initialization rather than on every validation.
+var allowedVoices = map[string]struct{}{
+	"default": {},
+	"male1":   {},
+	"female1": {},
+}
+
 // NatsWorker listens for TTS jobs on a NATS subject and processes them.
 type NatsWorker struct {
 	natsConnection   *nats.Conn
@@ -44,6 +77,8 @@ type NatsWorker struct {
 	store            core.ObjectStore
 	processor        core.TTSProcessor
 	log              *logger.Logger
+	ioSlots          chan struct{}
+	ioWaitGroup      sync.WaitGroup
 }
 
 // NewNatsWorker creates a new instance of a NATS worker.
@@ -62,30 +97,62 @@ func NewNatsWorker(
 		store:            store,
 		processor:        processor,
 		log:              log,
+		ioSlots:          make(chan struct{}, maxIOWorkers),
+		ioWaitGroup:      sync.WaitGroup{},
 	}, nil
 }
 
 // Run starts the worker and begins listening for messages.
-func (w *NatsWorker) Run(ctx context.Context) error {
-	sub, err := w.natsConnection.Subscribe(w.subject, w.handleMessage)
+//
+// NATS invokes the subscription handler for one message at a time, so at most
+// one chatllm inference runs at a time and concurrent requests never contend
+// for the same model and GPU. Jobs that arrive meanwhile wait in the
+// subscription's pending queue, which keeps the client's default limits. Jobs
+// beyond those limits are dropped by the client as a slow consumer and
+// reported through the connection's async error handler.
+//
+// Cancelling ctx stops intake and drains the jobs already pending. Every job's
+// context derives from jobCtx instead, so cancelling jobCtx aborts jobs in
+// flight, including the ones still draining.
+func (w *NatsWorker) Run(ctx, jobCtx context.Context) error {
+	sub, err := w.natsConnection.Subscribe(w.subject, func(msg *nats.Msg) {
+		w.handleMessage(jobCtx, msg)
+	})
 	if err != nil {
 		return fmt.Errorf("failed to subscribe to subject %s: %w", w.subject, err)
 	}
 
 	<-ctx.Done()
 
+	return w.drain(sub)
+}
+
+// drain stops delivery of new jobs, finishes the ones already pending and waits
+// for their uploads to complete.
+//
+// Drain only starts the process: the subscription stays valid until every
+// pending message has been handled and the last handler call has returned, so
+// drain polls it before waiting for the I/O pool.
+func (w *NatsWorker) drain(sub *nats.Subscription) error {
+	defer w.ioWaitGroup.Wait()
+
 	drainErr := sub.Drain()
 	if drainErr != nil {
 		return fmt.Errorf("failed to drain subscription: %w", drainErr)
 	}
 
+	ticker := time.NewTicker(drainPollInterval)
+	defer ticker.Stop()
+
+	for sub.IsValid() {
+		<-ticker.C
+	}
+
 	return nil
 }
 
-func (w *NatsWorker) handleMessage(msg *nats.Msg) {
-	ctx, cancel := context.WithTimeout(context.Background(), handleMessageTimeout)
-	defer cancel()
-
+// handleMessage decodes a delivered job and runs it.
+func (w *NatsWorker) handleMessage(jobCtx context.Context, msg *nats.Msg) {
 	event, err := w.parseAndValidateEvent(msg)
 	if err != nil {
 		w.log.Error("Failed to parse and validate event: %v", err)
@@ -93,13 +160,61 @@ func (w *NatsWorker) handleMessage(msg *nats.Msg) {
 		return
 	}
 
-	audioKey, processErr := w.processTTSJob(ctx, event)
+	w.runJob(jobCtx, msg, event)
+}
+
+// runJob synthesizes a single decoded job and hands the upload and reply to the
+// I/O pool, so the next job can start synthesizing while the previous audio is
+// still being stored.
+func (w *NatsWorker) runJob(jobCtx context.Context, msg *nats.Msg, event *events.TextProcessedEvent) {
+	ctx, cancel := context.WithTimeout(jobCtx, handleMessageTimeout)
+	defer cancel()
+
+	audioData, processErr := w.processTTSJob(ctx, event)
 	if processErr != nil {
 		w.log.Error("Failed to process TTS job for event %s: %v", event.Header.WorkflowID, processErr)
 
 		return
 	}
 
+	w.goIO(func() {
+		w.uploadAndReply(jobCtx, msg, event, audioData)
+	})
+}
+
+// goIO runs task on the bounded I/O pool, blocking until a slot is free.
+func (w *NatsWorker) goIO(task func()) {
+	w.ioSlots <- struct{}{}
+
+	w.ioWaitGroup.Add(1)
+
+	go func() {
+		defer func() {
+			<-w.ioSlots
+			w.ioWaitGroup.Done()
+		}()
+
+		task()
+	}()
+}
+
+// uploadAndReply stores the synthesized audio and replies with its key.
+func (w *NatsWorker) uploadAndReply(
+	jobCtx context.Context, msg *nats.Msg, event *events.TextProcessedEvent, audioData []byte,
+) {
+	ctx, cancel := context.WithTimeout(jobCtx, handleMessageTimeout)
+	defer cancel()
+
+	audioKey := uuid.NewString() + ".wav"
+
+	err := w.store.Upload(ctx, audioKey, audioData)
+	if err != nil {
+		w.log.Error("Failed to upload audio data for key '%s' (workflow %s): %v",
+			audioKey, event.Header.WorkflowID, err)
+
+		return
+	}
+
 	replyEvent := &events.AudioChunkCreatedEvent{
 		Header:     event.Header,
 		AudioKey:   audioKey,
@@ -113,54 +228,59 @@ func (w *NatsWorker) handleMessage(msg *nats.Msg) {
 	}
 }
 
-// processTTSJob handles the core logic of downloading text, processing it, and uploading audio.
-func (w *NatsWorker) processTTSJob(ctx context.Context, event *events.TextProcessedEvent) (string, error) {
+// processTTSJob handles the core logic of downloading text and processing it into audio.
+func (w *NatsWorker) processTTSJob(ctx context.Context, event *events.TextProcessedEvent) ([]byte, error) {
 	textData, err := w.store.Download(ctx, event.TextKey)
 	if err != nil {
-		return "", fmt.Errorf("failed to download text data for key '%s': %w", event.TextKey, err)
+		return nil, fmt.Errorf("failed to download text data for key '%s': %w", event.TextKey, err)
 	}
 
+	baseCfg := w.processor.GetConfig()
 	ttsCfg := core.TTSConfig{
-		ModelPath:         w.processor.GetConfig().ModelPath,
-		SnacModelPath:     w.processor.GetConfig().SnacModelPath,
+		ModelPath:         baseCfg.ModelPath,
+		SnacModelPath:     baseCfg.SnacModelPath,
 		Voice:             event.Voice,
 		Seed:              event.Seed,
 		NGL:               event.NGL,
 		TopP:              event.TopP,
 		RepetitionPenalty: event.RepetitionPenalty,
 		Temperature:       event.Temperature,
+		// Process-wide settings, fixed when the processor was built.
+		Threads:    0,
+		BatchSize:  0,
+		CacheDType: "",
 	}
 
 	validationErr := w.validateTTSConfig(ttsCfg)
 	if validationErr != nil {
 		w.log.Error("Invalid TTS configuration for workflow %s: %v", event.Header.WorkflowID, validationErr)
 
-		return "", validationErr
+		return nil, validationErr
 	}
 
 	audioData, err := w.processor.Process(ctx, textData, ttsCfg)
 	if err != nil {
-		return "", fmt.Errorf("failed to process text to speech: %w", err)
+		return nil, fmt.Errorf("failed to process text to speech: %w", err)
 	}
 
-	audioKey := uuid.NewString() + ".wav"
-
-	err = w.store.Upload(ctx, audioKey, audioData)
-	if err != nil {
-		return "", fmt.Errorf("failed to upload audio data for key '%s': %w", audioKey, err)
-	}
-
-	return audioKey, nil
+	return audioData, nil
 }
 
 // publishReplyEvent marshals and responds with the AudioChunkCreatedEvent.
 func (w *NatsWorker) publishReplyEvent(msg *nats.Msg, replyEvent *events.AudioChunkCreatedEvent) error {
-	replyData, err := json.Marshal(replyEvent)
+	replyData, _ := replyBufferPool.Get().(*bytes.Buffer)
+	defer func() {
+		replyData.Reset()
+		replyBufferPool.Put(replyData)
+	}()
+
+	err := json.NewEncoder(replyData).Encode(replyEvent)
 	if err != nil {
 		return fmt.Errorf("failed to marshal reply event: %w", err)
 	}
 
-	err = msg.Respond(replyData)
+	// Encode terminates the document with a newline that json.Marshal omits.
+	err = msg.Respond(bytes.TrimSuffix(replyData.Bytes(), []byte("\n")))
 	if err != nil {
 		return fmt.Errorf("failed to publish reply event: %w", err)
 	}
@@ -169,6 +289,10 @@ func (w *NatsWorker) publishReplyEvent(msg *nats.Msg, replyEvent *events.AudioCh
 }
 
 func (w *NatsWorker) parseAndValidateEvent(msg *nats.Msg) (*events.TextProcessedEvent, error) {
+	if len(msg.Data) > maxEventBytes {
+		return nil, fmt.Errorf("%w: %d bytes exceeds %d", ErrEventTooLarge, len(msg.Data), maxEventBytes)
+	}
+
 	var event events.TextProcessedEvent
 
 	err := json.Unmarshal(msg.Data, &event)
@@ -195,13 +319,7 @@ func (w *NatsWorker) validateTTSConfig(cfg core.TTSConfig) error {
 	}
 	// Similar to ModelPath, assuming trusted for now.
 
-	// Validate Voice (example with a simple whitelist)
-	allowedVoices := map[string]struct{}{
-		"default": {},
-		"male1":   {},
-		"female1": {},
-	}
-
+	// Validate Voice against the allowed set
 	if cfg.Voice == "" {
 		return ErrVoiceEmpty
 	}
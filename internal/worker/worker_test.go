@@ -5,6 +5,9 @@ import (
 	"context"
 	"encoding/json"
 	"errors"
+	"strings"
+	"sync"
+	"sync/atomic"
 	"testing"
 	"time"
 
@@ -28,11 +31,13 @@ var (
 
 // mockObjectStore is a mock implementation of the ObjectStore interface.
 type mockObjectStore struct {
+	mu                 sync.Mutex
 	downloadShouldFail bool
 	uploadShouldFail   bool
 	downloadedKey      string
 	uploadedKey        string
 	uploadedData       []byte
+	downloadCalls      atomic.Int32
 }
 
 func (m *mockObjectStore) Download(_ context.Context, key string) ([]byte, error) {
@@ -40,6 +45,7 @@ func (m *mockObjectStore) Download(_ context.Context, key string) ([]byte, error
 		return nil, errMockDownload
 	}
 
+	m.downloadCalls.Add(1)
 	m.downloadedKey = key
 
 	return []byte("sample text"), nil
@@ -50,6 +56,9 @@ func (m *mockObjectStore) Upload(_ context.Context, key string, data []byte) err
 		return errMockUpload
 	}
 
+	m.mu.Lock()
+	defer m.mu.Unlock()
+
 	m.uploadedKey = key
 	m.uploadedData = data
 
@@ -62,17 +71,36 @@ type mockTTSProcessor struct {
 	processedText     []byte
 	processedCfg      core.TTSConfig
 	config            core.TTSConfig
+	processDelay      time.Duration
+	processCalls      atomic.Int32
+	activeCalls       atomic.Int32
+	maxActiveCalls    atomic.Int32
 }
 
 func (m *mockTTSProcessor) GetConfig() core.TTSConfig {
 	return m.config
 }
 
-func (m *mockTTSProcessor) Process(_ context.Context, text []byte, cfg core.TTSConfig) ([]byte, error) {
+func (m *mockTTSProcessor) Process(ctx context.Context, text []byte, cfg core.TTSConfig) ([]byte, error) {
 	if m.processShouldFail {
 		return nil, errMockProcess
 	}
 
+	m.processCalls.Add(1)
+
+	active := m.activeCalls.Add(1)
+	defer m.activeCalls.Add(-1)
+
+	if active > m.maxActiveCalls.Load() {
+		m.maxActiveCalls.Store(active)
+	}
+
+	select {
+	case <-time.After(m.processDelay):
+	case <-ctx.Done():
+		return nil, ctx.Err()
+	}
+
 	m.processedText = text
 	m.processedCfg = cfg
 
@@ -111,15 +139,21 @@ func setupTest(t *testing.T) (
 	t.Helper()
 
 	mockStore := &mockObjectStore{
+		mu:                 sync.Mutex{},
 		downloadShouldFail: false,
 		uploadShouldFail:   false,
 		downloadedKey:      "",
 		uploadedKey:        "",
 		uploadedData:       nil,
+		downloadCalls:      atomic.Int32{},
 	}
 	mockProcessor := &mockTTSProcessor{
 		processShouldFail: false,
 		processedText:     nil,
+		processDelay:      0,
+		processCalls:      atomic.Int32{},
+		activeCalls:       atomic.Int32{},
+		maxActiveCalls:    atomic.Int32{},
 		processedCfg: core.TTSConfig{
 			ModelPath:         "dummy_model_path",
 			SnacModelPath:     "dummy_snac_model_path",
@@ -129,6 +163,9 @@ func setupTest(t *testing.T) (
 			TopP:              0.0,
 			RepetitionPenalty: 0.0,
 			Temperature:       0.0,
+			Threads:           0,
+			BatchSize:         0,
+			CacheDType:        "",
 		},
 		config: core.TTSConfig{
 			ModelPath:         "dummy_model_path",
@@ -139,6 +176,9 @@ func setupTest(t *testing.T) (
 			TopP:              0.0,
 			RepetitionPenalty: 0.0,
 			Temperature:       0.0,
+			Threads:           0,
+			BatchSize:         0,
+			CacheDType:        "",
 		},
 	}
 
@@ -170,7 +210,7 @@ func TestMessageHandler_Success(t *testing.T) {
 	errChan := make(chan error, 1)
 
 	go func() {
-		errChan <- workerInstance.Run(ctx)
+		errChan <- workerInstance.Run(ctx, context.Background())
 	}()
 
 	testEvent := &events.TextProcessedEvent{
@@ -185,12 +225,12 @@ func TestMessageHandler_Success(t *testing.T) {
 		PNGKey:            "",
 		PageNumber:        0,
 		TotalPages:        0,
-		Voice:             "",
+		Voice:             "default",
 		Seed:              0,
 		NGL:               0,
-		TopP:              0,
-		RepetitionPenalty: 0,
-		Temperature:       0,
+		TopP:              0.95,
+		RepetitionPenalty: 1.1,
+		Temperature:       0.7,
 	}
 	eventData, err := json.Marshal(testEvent)
 	require.NoError(t, err)
@@ -216,3 +256,220 @@ func TestMessageHandler_Success(t *testing.T) {
 	shutdownErr := <-errChan
 	assert.NoError(t, shutdownErr, "worker.Run should not error on graceful shutdown")
 }
+
+// newTestEvent returns a valid TextProcessedEvent using the given seed.
+func newTestEvent(seed int) *events.TextProcessedEvent {
+	return &events.TextProcessedEvent{
+		Header: events.EventHeader{
+			Timestamp:  time.Now(),
+			WorkflowID: uuid.NewString(),
+			EventID:    uuid.NewString(),
+			UserID:     "",
+			TenantID:   "",
+		},
+		TextKey:           "test-text-key",
+		PNGKey:            "",
+		PageNumber:        0,
+		TotalPages:        0,
+		Voice:             "default",
+		Seed:              seed,
+		NGL:               0,
+		TopP:              0.95,
+		RepetitionPenalty: 1.1,
+		Temperature:       0.7,
+	}
+}
+
+// TestRun_SerializesProcessing guards the one-inference-at-a-time invariant
+// that NATS's per-subscription delivery provides, now that uploads run on a
+// separate I/O pool.
+func TestRun_SerializesProcessing(t *testing.T) {
+	t.Parallel()
+
+	workerInstance, _, mockProcessor, ctx, cancel, natsConnection := setupTest(t)
+	defer cancel()
+
+	mockProcessor.processDelay = 20 * time.Millisecond
+
+	errChan := make(chan error, 1)
+
+	go func() {
+		errChan <- workerInstance.Run(ctx, context.Background())
+	}()
+
+	const concurrentRequests = 4
+
+	var waitGroup sync.WaitGroup
+
+	requestErrs := make(chan error, concurrentRequests)
+
+	for requestIndex := 0; requestIndex < concurrentRequests; requestIndex++ {
+		waitGroup.Add(1)
+
+		eventData, err := json.Marshal(newTestEvent(requestIndex))
+		require.NoError(t, err)
+
+		go func() {
+			defer waitGroup.Done()
+
+			_, requestErr := natsConnection.Request("test_subject", eventData, 5*time.Second)
+			requestErrs <- requestErr
+		}()
+	}
+
+	waitGroup.Wait()
+	close(requestErrs)
+
+	for requestErr := range requestErrs {
+		require.NoError(t, requestErr)
+	}
+
+	assert.Equal(t, int32(1), mockProcessor.maxActiveCalls.Load(), "inference calls must not overlap")
+
+	cancel()
+
+	shutdownErr := <-errChan
+	assert.NoError(t, shutdownErr)
+}
+
+func TestRun_FinishesQueuedJobsOnShutdown(t *testing.T) {
+	t.Parallel()
+
+	workerInstance, _, mockProcessor, ctx, cancel, natsConnection := setupTest(t)
+	defer cancel()
+
+	mockProcessor.processDelay = 20 * time.Millisecond
+
+	errChan := make(chan error, 1)
+
+	go func() {
+		errChan <- workerInstance.Run(ctx, context.Background())
+	}()
+
+	// A first round trip guarantees the worker is subscribed.
+	eventData, err := json.Marshal(newTestEvent(0))
+	require.NoError(t, err)
+
+	_, err = natsConnection.Request("test_subject", eventData, 5*time.Second)
+	require.NoError(t, err)
+
+	const queuedRequests = 6
+
+	inbox := nats.NewInbox()
+	replies := make(chan *nats.Msg, queuedRequests)
+
+	replySub, err := natsConnection.ChanSubscribe(inbox, replies)
+	require.NoError(t, err)
+
+	defer func() {
+		assert.NoError(t, replySub.Unsubscribe())
+	}()
+
+	for requestIndex := 1; requestIndex <= queuedRequests; requestIndex++ {
+		eventData, err := json.Marshal(newTestEvent(requestIndex))
+		require.NoError(t, err)
+
+		require.NoError(t, natsConnection.PublishRequest("test_subject", inbox, eventData))
+	}
+
+	require.NoError(t, natsConnection.Flush())
+
+	// Shut down while the jobs are still queued behind the slow processor.
+	cancel()
+
+	shutdownErr := <-errChan
+	require.NoError(t, shutdownErr)
+
+	for received := 0; received < queuedRequests; received++ {
+		select {
+		case <-replies:
+		case <-time.After(5 * time.Second):
+			t.Fatalf("received %d of %d replies after shutdown", received, queuedRequests)
+		}
+	}
+
+	assert.Equal(t, int32(queuedRequests+1), mockProcessor.processCalls.Load())
+}
+
+func TestRun_RejectsOversizedEvent(t *testing.T) {
+	t.Parallel()
+
+	workerInstance, mockStore, mockProcessor, ctx, cancel, natsConnection := setupTest(t)
+	defer cancel()
+
+	errChan := make(chan error, 1)
+
+	go func() {
+		errChan <- workerInstance.Run(ctx, context.Background())
+	}()
+
+	// A first round trip guarantees the worker is subscribed.
+	eventData, err := json.Marshal(newTestEvent(0))
+	require.NoError(t, err)
+
+	_, err = natsConnection.Request("test_subject", eventData, 5*time.Second)
+	require.NoError(t, err)
+
+	oversizedEvent := newTestEvent(1)
+	oversizedEvent.PNGKey = strings.Repeat("x", 32*1024)
+
+	oversizedData, err := json.Marshal(oversizedEvent)
+	require.NoError(t, err)
+
+	_, err = natsConnection.Request("test_subject", oversizedData, 200*time.Millisecond)
+	require.ErrorIs(t, err, nats.ErrTimeout, "oversized events must not get a reply")
+
+	// Jobs run in order, so once this reply arrives the oversized event has
+	// been handled too.
+	_, err = natsConnection.Request("test_subject", eventData, 5*time.Second)
+	require.NoError(t, err)
+
+	assert.Equal(t, int32(2), mockStore.downloadCalls.Load(), "oversized event must not be downloaded")
+	assert.Equal(t, int32(2), mockProcessor.processCalls.Load(), "oversized event must not be processed")
+
+	cancel()
+
+	shutdownErr := <-errChan
+	assert.NoError(t, shutdownErr)
+}
+
+func TestRun_JobContextCancellationAbortsDrain(t *testing.T) {
+	t.Parallel()
+
+	workerInstance, mockStore, mockProcessor, ctx, cancel, natsConnection := setupTest(t)
+	defer cancel()
+
+	mockProcessor.processDelay = time.Minute
+
+	jobCtx, hardStop := context.WithCancel(context.Background())
+	defer hardStop()
+
+	errChan := make(chan error, 1)
+
+	go func() {
+		errChan <- workerInstance.Run(ctx, jobCtx)
+	}()
+
+	eventData, err := json.Marshal(newTestEvent(0))
+	require.NoError(t, err)
+
+	require.Eventually(t, func() bool {
+		publishErr := natsConnection.PublishRequest("test_subject", nats.NewInbox(), eventData)
+
+		return publishErr == nil && mockProcessor.processCalls.Load() == 1
+	}, 5*time.Second, 50*time.Millisecond)
+
+	// A graceful shutdown would wait a minute for the job; cancelling the job
+	// context must abort it instead.
+	cancel()
+	hardStop()
+
+	select {
+	case shutdownErr := <-errChan:
+		require.NoError(t, shutdownErr)
+	case <-time.After(5 * time.Second):
+		t.Fatal("worker did not stop after the job context was cancelled")
+	}
+
+	assert.Empty(t, mockStore.uploadedKey, "aborted job must not upload audio")
+}